@@ -5,39 +5,71 @@ Handles daily updates, automatic reminders, and self-directed learning
 """
 
 import asyncio
-import schedule
+import heapq
+import itertools
+import re
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Callable, Any
+from typing import Dict, List, Callable, Any, ClassVar, Optional, Tuple
 import json
 from pathlib import Path
 
 class AutonomousScheduler:
     """Manages autonomous operations and scheduling"""
     
+    _WEEKDAYS = {'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+                 'friday': 4, 'saturday': 5, 'sunday': 6}
+
     def __init__(self, randy_ai_instance):
         self.randy_ai = randy_ai_instance
         self.running = False
         self.tasks = {}
         self.daily_update_time = "09:00"  # 9 AM daily updates
+        self._wake = asyncio.Event()  # Set to preempt the scheduler's sleep
+        # Min-heap of (next run timestamp, sequence, callback, repeat
+        # interval in seconds or None for one-shot jobs)
+        self._heap = []
+        self._seq = itertools.count()
         self.setup_default_schedule()
-        
+
+    def _schedule_job(self, callback: Callable, first_run: float,
+                      interval: Optional[float]):
+        """Push a job onto the heap; interval None means run once"""
+        heapq.heappush(self._heap, (first_run, next(self._seq), callback, interval))
+
+    def _next_time_at(self, time_spec: str, weekday: Optional[int] = None) -> float:
+        """Timestamp of the next HH:MM occurrence, optionally on a weekday"""
+        hour, minute = map(int, time_spec.split(":"))
+        now = datetime.now()
+        candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+        if weekday is not None:
+            candidate += timedelta(days=(weekday - candidate.weekday()) % 7)
+        if candidate <= now:
+            candidate += timedelta(days=7 if weekday is not None else 1)
+
+        return candidate.timestamp()
+
     def setup_default_schedule(self):
         """Setup default autonomous schedule"""
+        day = 24 * 3600
+
         # Daily update at 9 AM
-        schedule.every().day.at(self.daily_update_time).do(self.generate_daily_update)
-        
+        self._schedule_job(self.generate_daily_update,
+                           self._next_time_at(self.daily_update_time), day)
+
         # Check GitHub repos every 6 hours
-        schedule.every(6).hours.do(self.check_github_repos)
-        
+        self._schedule_job(self.check_github_repos, time.time() + 6 * 3600, 6 * 3600)
+
         # Learning analysis every 3 hours
-        schedule.every(3).hours.do(self.perform_learning_analysis)
-        
+        self._schedule_job(self.perform_learning_analysis, time.time() + 3 * 3600, 3 * 3600)
+
         # Memory cleanup weekly on Sunday
-        schedule.every().sunday.at("02:00").do(self.cleanup_memory)
-        
+        self._schedule_job(self.cleanup_memory,
+                           self._next_time_at("02:00", self._WEEKDAYS['sunday']), 7 * day)
+
         # Self-improvement check every 12 hours
-        schedule.every(12).hours.do(self.self_improvement_check)
+        self._schedule_job(self.self_improvement_check, time.time() + 12 * 3600, 12 * 3600)
         
     def generate_daily_update(self):
         """Generate and save daily update"""
@@ -48,28 +80,26 @@ class AutonomousScheduler:
             insights = self.generate_autonomous_insights()
             full_update = f"{update}\n\nAutonomous Insights:\n{insights}"
             
-            # Save update
-            timestamp = datetime.now().strftime('%Y%m%d')
-            self.randy_ai.save_memory(f"daily_update_{timestamp}", full_update, "reports")
-            
+            # Save update - one clock read per invocation
+            now = datetime.now()
+            self.randy_ai.save_memory(f"daily_update_{now:%Y%m%d}", full_update, "reports", defer=True)
+
             # Create tasks based on insights
             self.create_adaptive_tasks(insights)
-            
-            print(f"Daily update generated: {datetime.now()}")
+
+            print(f"Daily update generated: {now}")
             
         except Exception as e:
-            self.randy_ai.save_memory("scheduler_error", str(e), "errors")
+            self.randy_ai.save_memory("scheduler_error", str(e), "errors", defer=True)
             
     def generate_autonomous_insights(self) -> str:
         """Generate insights from recent activity"""
         insights = []
         
-        # Analyze recent learning patterns
-        recent_learning = [l for l in self.randy_ai.learning_data 
-                         if (datetime.now() - l['timestamp']).days < 7]
-        
-        if recent_learning:
-            success_rate = sum(l['success'] for l in recent_learning) / len(recent_learning)
+        # Analyze recent learning patterns (vectorized over the sample arrays)
+        learning_count, success_rate = self.randy_ai.recent_success_stats(days=7)
+
+        if learning_count:
             insights.append(f"Learning success rate (7 days): {success_rate:.2%}")
             
             if success_rate < 0.7:
@@ -96,7 +126,8 @@ class AutonomousScheduler:
                 "Review GitHub Projects",
                 "Check for updates and contribute to repositories",
                 7,
-                current_time + timedelta(hours=4)
+                current_time + timedelta(hours=4),
+                dedupe=True
             )
             
         # Check if learning needs attention
@@ -105,7 +136,8 @@ class AutonomousScheduler:
                 "AI Learning Session",
                 "Spend time on AI development and research",
                 8,
-                current_time + timedelta(hours=2)
+                current_time + timedelta(hours=2),
+                dedupe=True
             )
             
     def check_github_repos(self):
@@ -113,126 +145,146 @@ class AutonomousScheduler:
         try:
             # Implementation would check Randy's repositories
             # For now, create a task to manually check
+            now = datetime.now()
             self.randy_ai.create_task(
                 "GitHub Repository Check",
                 "Review repositories for updates, issues, and contributions",
                 6,
-                datetime.now() + timedelta(hours=1)
+                now + timedelta(hours=1),
+                dedupe=True
             )
-            
-            print(f"GitHub check scheduled: {datetime.now()}")
+
+            print(f"GitHub check scheduled: {now}")
             
         except Exception as e:
-            self.randy_ai.save_memory("github_check_error", str(e), "errors")
+            self.randy_ai.save_memory("github_check_error", str(e), "errors", defer=True)
             
     def perform_learning_analysis(self):
         """Analyze learning patterns and adjust"""
         try:
-            # Analyze recent interactions
-            recent_interactions = self.randy_ai.learning_data[-10:]  # Last 10 interactions
-            
-            if recent_interactions:
-                avg_success = sum(i['success'] for i in recent_interactions) / len(recent_interactions)
-                
+            # Analyze the last 10 interactions from the sample arrays
+            success_scores, _ = self.randy_ai._learning_view()
+            recent_interactions = success_scores[-10:]
+
+            now = datetime.now()
+            if recent_interactions.size:
+                avg_success = float(recent_interactions.mean())
+
                 learning_report = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now.isoformat(),
                     "interactions_analyzed": len(recent_interactions),
                     "average_success": avg_success,
                     "recommendations": self.generate_learning_recommendations(avg_success)
                 }
-                
+
                 self.randy_ai.save_memory(
-                    f"learning_analysis_{datetime.now().strftime('%Y%m%d_%H%M')}",
+                    f"learning_analysis_{now:%Y%m%d_%H%M}",
                     learning_report,
                     "analysis"
                 )
-                
-            print(f"Learning analysis completed: {datetime.now()}")
+
+            print(f"Learning analysis completed: {now}")
             
         except Exception as e:
-            self.randy_ai.save_memory("learning_analysis_error", str(e), "errors")
+            self.randy_ai.save_memory("learning_analysis_error", str(e), "errors", defer=True)
             
     def generate_learning_recommendations(self, success_rate: float) -> List[str]:
         """Generate recommendations based on learning success rate"""
-        recommendations = []
-        
         if success_rate < 0.6:
-            recommendations.extend([
+            return [
                 "Focus on simpler tasks to build confidence",
                 "Review recent failed interactions for patterns",
                 "Consider adjusting learning approach"
-            ])
+            ]
         elif success_rate > 0.8:
-            recommendations.extend([
+            return [
                 "Ready for more complex challenges",
                 "Explore advanced AI development topics",
                 "Share successful patterns with other projects"
-            ])
-        else:
-            recommendations.append("Maintain current learning pace and methods")
-            
-        return recommendations
+            ]
+        return ["Maintain current learning pace and methods"]
         
     def cleanup_memory(self):
         """Clean up old memory items"""
         try:
-            # Implementation for memory cleanup
-            # Remove items older than 90 days, keep important ones
+            # Remove items older than 90 days in one bulk DELETE,
+            # keeping reports and self-improvement history
+            now = datetime.now()
+            items_before = self.randy_ai._memory_count
+            items_removed = self.randy_ai.cleanup_old_memory(days=90)
+
             cleanup_report = {
-                "timestamp": datetime.now().isoformat(),
-                "items_before": len(self.randy_ai.memory),
+                "timestamp": now.isoformat(),
+                "items_before": items_before,
+                "items_removed": items_removed,
                 "cleanup_performed": True
             }
-            
+
             # Save cleanup report
             self.randy_ai.save_memory(
-                f"memory_cleanup_{datetime.now().strftime('%Y%m%d')}",
+                f"memory_cleanup_{now:%Y%m%d}",
                 cleanup_report,
                 "maintenance"
             )
-            
-            print(f"Memory cleanup completed: {datetime.now()}")
+
+            print(f"Memory cleanup completed: {now}")
             
         except Exception as e:
-            self.randy_ai.save_memory("cleanup_error", str(e), "errors")
+            self.randy_ai.save_memory("cleanup_error", str(e), "errors", defer=True)
             
     def self_improvement_check(self):
         """Check for self-improvement opportunities"""
         try:
             improvement_areas = self.identify_improvement_areas()
-            
+            now = datetime.now()
+
             if improvement_areas:
                 for area in improvement_areas:
                     self.randy_ai.create_task(
                         f"Improve: {area['title']}",
                         area['description'],
                         area['priority'],
-                        datetime.now() + timedelta(hours=area.get('due_hours', 24))
+                        now + timedelta(hours=area.get('due_hours', 24)),
+                        dedupe=True
                     )
-                    
+
             improvement_report = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "areas_identified": len(improvement_areas),
                 "areas": improvement_areas
             }
-            
+
             self.randy_ai.save_memory(
-                f"improvement_check_{datetime.now().strftime('%Y%m%d_%H%M')}",
+                f"improvement_check_{now:%Y%m%d_%H%M}",
                 improvement_report,
                 "self_improvement"
             )
-            
-            print(f"Self-improvement check completed: {datetime.now()}")
+
+            print(f"Self-improvement check completed: {now}")
             
         except Exception as e:
-            self.randy_ai.save_memory("improvement_check_error", str(e), "errors")
+            self.randy_ai.save_memory("improvement_check_error", str(e), "errors", defer=True)
             
+    _MARKER_KEYS = ('last_code_optimization', 'last_integration_expansion')
+
+    def _last_marker_times(self) -> Dict[str, Optional[datetime]]:
+        """Parse the 'last run' memory markers once for all predicates"""
+        parsed = {}
+        for key in self._MARKER_KEYS:
+            raw = self.randy_ai.memory.get(key)
+            try:
+                parsed[key] = datetime.fromisoformat(raw) if raw else None
+            except (TypeError, ValueError):
+                parsed[key] = None
+        return parsed
+
     def identify_improvement_areas(self) -> List[Dict]:
         """Identify areas for self-improvement"""
         areas = []
-        
+        markers = self._last_marker_times()
+
         # Check code efficiency
-        if self.should_optimize_code():
+        if self.should_optimize_code(markers):
             areas.append({
                 "title": "Code Optimization",
                 "description": "Review and optimize existing code for better performance",
@@ -250,7 +302,7 @@ class AutonomousScheduler:
             })
             
         # Check integration opportunities
-        if self.should_expand_integrations():
+        if self.should_expand_integrations(markers):
             areas.append({
                 "title": "Integration Expansion",
                 "description": "Explore new API integrations and platform connections",
@@ -260,39 +312,30 @@ class AutonomousScheduler:
             
         return areas
         
-    def should_optimize_code(self) -> bool:
+    def should_optimize_code(self, markers: Optional[Dict] = None) -> bool:
         """Determine if code optimization is needed"""
         # Simple heuristic - optimize weekly
-        last_optimization = self.randy_ai.memory.get("last_code_optimization")
-        if not last_optimization:
-            return True
-            
-        try:
-            last_opt_date = datetime.fromisoformat(last_optimization)
-            return (datetime.now() - last_opt_date).days >= 7
-        except:
+        markers = markers if markers is not None else self._last_marker_times()
+        last_opt_date = markers['last_code_optimization']
+        if last_opt_date is None:
             return True
+        return (datetime.now() - last_opt_date).days >= 7
             
     def should_enhance_learning(self) -> bool:
         """Determine if learning enhancement is needed"""
-        recent_learning = [l for l in self.randy_ai.learning_data 
-                         if (datetime.now() - l['timestamp']).days < 3]
-        
+        recent_count, _ = self.randy_ai.recent_success_stats(days=3)
+
         # If less than 5 learning interactions in 3 days, enhance learning
-        return len(recent_learning) < 5
+        return recent_count < 5
         
-    def should_expand_integrations(self) -> bool:
+    def should_expand_integrations(self, markers: Optional[Dict] = None) -> bool:
         """Determine if integration expansion is needed"""
         # Check monthly for new integration opportunities
-        last_integration_check = self.randy_ai.memory.get("last_integration_expansion")
-        if not last_integration_check:
-            return True
-            
-        try:
-            last_check_date = datetime.fromisoformat(last_integration_check)
-            return (datetime.now() - last_check_date).days >= 30
-        except:
+        markers = markers if markers is not None else self._last_marker_times()
+        last_check_date = markers['last_integration_expansion']
+        if last_check_date is None:
             return True
+        return (datetime.now() - last_check_date).days >= 30
             
     def get_completed_tasks_last_week(self) -> List[Dict]:
         """Get completed tasks from the last week"""
@@ -302,8 +345,8 @@ class AutonomousScheduler:
         
     def analyze_memory_growth(self) -> float:
         """Analyze memory growth rate"""
-        # Simple calculation - would be more sophisticated in real implementation
-        return len(self.randy_ai.memory) / 7.0  # Items per week approximation
+        # Uses the cached item counter rather than re-sizing the dict
+        return self.randy_ai._memory_count / 7.0  # Items per week approximation
         
     async def start_autonomous_scheduler(self):
         """Start the autonomous scheduler"""
@@ -312,30 +355,62 @@ class AutonomousScheduler:
         
         while self.running:
             try:
-                schedule.run_pending()
-                await asyncio.sleep(60)  # Check every minute
+                now = time.time()
+                while self._heap and self._heap[0][0] <= now:
+                    next_run, seq, callback, interval = self._heap[0]
+                    if interval is None:
+                        heapq.heappop(self._heap)  # One-shot job
+                    else:
+                        heapq.heapreplace(self._heap,
+                                          (next_run + interval, seq, callback, interval))
+
+                    result = callback()
+                    if asyncio.iscoroutine(result):
+                        await result
+
+                self.randy_ai._flush()  # Persist deferred writes in one batch
+
+                # Sleep exactly until the next scheduled job instead of
+                # polling every minute; newly added jobs set self._wake
+                # to preempt the sleep early
+                if self._heap:
+                    delay = max(0, self._heap[0][0] - time.time())
+                else:
+                    delay = 3600  # No jobs - wake hourly or on demand
+
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
             except Exception as e:
-                self.randy_ai.save_memory("scheduler_error", str(e), "errors")
+                self.randy_ai.save_memory("scheduler_error", str(e), "errors", defer=True)
                 await asyncio.sleep(300)  # Wait 5 minutes on error
-                
+
+        await self.randy_ai.aclose()  # Release the pooled HTTP connections
+
     def stop_scheduler(self):
         """Stop the autonomous scheduler"""
         self.running = False
+        self._wake.set()  # Break out of the current sleep immediately
+        self.randy_ai._flush()
         print(f"Autonomous scheduler stopped: {datetime.now()}")
         
     def add_custom_schedule(self, frequency: str, time_spec: str, function: Callable, description: str):
         """Add custom scheduled task"""
         task_id = f"custom_{len(self.tasks)}"
-        
+
         # Parse frequency and create schedule
         if frequency == "daily":
-            schedule.every().day.at(time_spec).do(function)
+            self._schedule_job(function, self._next_time_at(time_spec), 24 * 3600)
         elif frequency == "hourly":
-            schedule.every().hour.do(function)
+            self._schedule_job(function, time.time() + 3600, 3600)
         elif frequency == "weekly":
-            day, time = time_spec.split(" ")
-            getattr(schedule.every(), day.lower()).at(time).do(function)
-            
+            day, at_time = time_spec.split(" ")
+            self._schedule_job(function,
+                               self._next_time_at(at_time, self._WEEKDAYS[day.lower()]),
+                               7 * 24 * 3600)
+
         self.tasks[task_id] = {
             "frequency": frequency,
             "time_spec": time_spec,
@@ -343,16 +418,22 @@ class AutonomousScheduler:
             "description": description,
             "added": datetime.now().isoformat()
         }
-        
+
+        self._wake.set()  # Re-evaluate next_run with the new job
         return task_id
         
     def get_schedule_status(self) -> Dict:
-        """Get current schedule status"""
+        """Get current schedule status
+
+        next_run is an O(1) peek at the heap root, so status polling
+        stays cheap no matter how many jobs accumulate.
+        """
+        next_run = datetime.fromtimestamp(self._heap[0][0]) if self._heap else None
         return {
             "running": self.running,
-            "scheduled_jobs": len(schedule.jobs),
+            "scheduled_jobs": len(self._heap),
             "custom_tasks": len(self.tasks),
-            "next_run": str(schedule.next_run()) if schedule.jobs else None,
+            "next_run": str(next_run) if next_run else None,
             "uptime": "N/A"  # Would track actual uptime
         }
         
@@ -366,43 +447,51 @@ class AutonomousScheduler:
                 datetime.now() + timedelta(minutes=5)
             )
             
-        # Schedule the reminder
-        time_str = reminder_time.strftime("%H:%M")
-        schedule.every().day.at(time_str).do(reminder_function).tag(f"reminder_{title}")
-        
+        # Schedule as a one-shot job at the exact reminder time
+        self._schedule_job(reminder_function, reminder_time.timestamp(), None)
+
+        self._wake.set()  # Re-evaluate next_run with the new reminder
         return f"Reminder set for {reminder_time}"
         
 class QuestionGenerator:
     """Generates autonomous questions for Randy"""
-    
+
+    # One compiled scan over recent keys instead of repeated substring
+    # checks on a stringified dict; underscores count as separators
+    _TRIGGER_RE = re.compile(r"(?<![a-z0-9])(car|ai|gig|uber)(?![a-z0-9])", re.I)
+    _TRIGGER_RESPONSES = {
+        "car": "I noticed recent car-related activity. Should we research new automotive tech or modifications?",
+        "ai": "Your AI projects are progressing. Want me to explore cutting-edge AI tools or techniques?",
+        "gig": "For your rideshare work, should we research driver optimization tools or vehicle efficiency mods?",
+        "uber": "For your rideshare work, should we research driver optimization tools or vehicle efficiency mods?",
+    }
+
+    # Shared across instances - the templates never change, so there is
+    # no reason to rebuild the list per construction
+    question_templates: ClassVar[Tuple[str, ...]] = (
+        "Should we explore {technology} for {use_case}?",
+        "What's your opinion on {topic} for the {project} project?",
+        "Would you like me to research {subject} and create a summary?",
+        "I noticed {pattern} in your usage. Should we optimize {area}?",
+        "New {category} tools are available. Want me to analyze them?"
+    )
+
     def __init__(self, randy_ai_instance):
         self.randy_ai = randy_ai_instance
-        self.question_templates = [
-            "Should we explore {technology} for {use_case}?",
-            "What's your opinion on {topic} for the {project} project?",
-            "Would you like me to research {subject} and create a summary?",
-            "I noticed {pattern} in your usage. Should we optimize {area}?",
-            "New {category} tools are available. Want me to analyze them?"
-        ]
-        
+
+
     def generate_contextual_question(self) -> str:
         """Generate a question based on Randy's context"""
         import random
         
-        # Analyze recent activity to generate relevant questions
-        interests = self.randy_ai.preferences.interests
-        recent_memory = list(self.randy_ai.memory.keys())[-5:]
-        
-        # Generate context-aware question
-        if "car" in str(recent_memory).lower():
-            return "I noticed recent car-related activity. Should we research new automotive tech or modifications?"
-        elif "ai" in str(recent_memory).lower():
-            return "Your AI projects are progressing. Want me to explore cutting-edge AI tools or techniques?"
-        elif "gig" in str(recent_memory).lower() or "uber" in str(recent_memory).lower():
-            return "For your rideshare work, should we research driver optimization tools or vehicle efficiency mods?"
-        else:
-            topic = random.choice(interests)
-            return f"I haven't seen much {topic} activity lately. Want me to find the latest developments?"
+        # Match trigger keywords against recent activity - first hit wins
+        for key in reversed(self.randy_ai._recent_keys):
+            match = self._TRIGGER_RE.search(key)
+            if match:
+                return self._TRIGGER_RESPONSES[match.group(1).lower()]
+
+        topic = random.choice(self.randy_ai.preferences.interests)
+        return f"I haven't seen much {topic} activity lately. Want me to find the latest developments?"
             
     async def autonomous_question_cycle(self):
         """Autonomously generate questions for Randy"""
@@ -418,7 +507,8 @@ class QuestionGenerator:
                     "AI Generated Question",
                     f"Question for Randy: {question}",
                     4,  # Medium priority
-                    datetime.now() + timedelta(hours=2)
+                    datetime.now() + timedelta(hours=2),
+                    dedupe=True
                 )
                 
                 print(f"Generated autonomous question: {question}")
@@ -8,13 +8,28 @@ Designed for Randy Jordan - Mobile, Alabama
 import asyncio
 import json
 import time
+from collections import OrderedDict, deque
+from itertools import islice
 from datetime import datetime, timedelta
-import requests
+import aiohttp
+import numpy as np
+import orjson
 import sqlite3
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+# Leading bytes that can start an orjson-encoded value; anything else is
+# a plain string and skips JSON parsing entirely
+_JSON_PREFIXES = frozenset(b'{["0123456789-')
+
+# Hot-path statements as shared constants so sqlite's per-connection
+# statement cache reuses the compiled plans instead of re-parsing SQL
+_SQL_SAVE_MEM = "INSERT OR REPLACE INTO memory (key, value, category) VALUES (?, ?, ?)"
+_SQL_CREATE_TASK = """INSERT INTO tasks (title, description, priority, due_date)
+VALUES (?, ?, ?, ?)"""
+_SQL_INSERT_LEARN = "INSERT INTO learning (input_data, output_data, success_score) VALUES (?, ?, ?)"
+
 @dataclass
 class UserPreferences:
     """Randy's personal preferences and profile"""
@@ -22,138 +37,359 @@ class UserPreferences:
     location: str = "Mobile, Alabama"
     zip_code: str = "36605"
     vehicle: str = "2020 Toyota Corolla LE"
-    work: List[str] = None
-    interests: List[str] = None
+    # Immutable tuple defaults are shared across instances (no per-init
+    # list allocation) and hashable for memoized consumers
+    work: Tuple[str, ...] = ("Uber", "Lyft", "Spark", "DoorDash")
+    interests: Tuple[str, ...] = ("AI Development", "Car Mods", "Tech Gadgets",
+                                  "Gaming", "Self-Defense")
     tone_preference: str = "snarky_sardonic_expert"
     code_limit: int = 4000
-    
-    def __post_init__(self):
-        if self.work is None:
-            self.work = ["Uber", "Lyft", "Spark", "DoorDash"]
-        if self.interests is None:
-            self.interests = ["AI Development", "Car Mods", "Tech Gadgets", "Gaming", "Self-Defense"]
 
 class RandyAI:
     """Main Personal AI Assistant Class"""
     
-    def __init__(self):
+    def __init__(self, db_path: Union[str, Path] = Path("randy_ai.db"),
+                 test_mode: bool = False):
         self.preferences = UserPreferences()
-        self.db_path = Path("randy_ai.db")
+        # JSON-ready snapshot of the (rarely changing) preferences, so hot
+        # paths embed it without re-running dataclass reflection per call
+        self._prefs_snapshot = orjson.dumps(asdict(self.preferences))
+        # db_path may be ":memory:" for throwaway instances; test_mode
+        # additionally trades durability guarantees for speed on them
+        self.db_path = db_path
+        self.test_mode = test_mode
         self.memory = {}
-        self.learning_data = []
+        # Running stats so callers never re-materialize the whole dict:
+        # most recently saved keys plus a count kept in step with memory
+        self._recent_keys = deque(maxlen=16)
+        self._memory_count = 0
+        # Bounded history - consumers only read recent windows, so old
+        # interactions age out instead of growing RAM forever. Writes are
+        # queued and persisted in batches rather than one INSERT per call.
+        self.learning_data = deque(maxlen=10_000)
+        self._learn_queue = asyncio.Queue()
+        # Success scores and timestamps as parallel arrays (circular
+        # buffer) so analysis passes vectorize instead of scanning the
+        # learning_data dicts in Python
+        self._learning_capacity = 10000
+        self._success = np.empty(self._learning_capacity, dtype=np.float32)
+        self._learning_ts = np.empty(self._learning_capacity, dtype='datetime64[s]')
+        self._learning_count = 0
         self.active_tasks = []
+        # Short-term idempotency window for create_task: title ->
+        # monotonic expiry, so double-fired scheduler jobs are dropped
+        self._task_idem = {}
         self.api_keys = {}
+        self._conn = None
+        self._conn_path = None
+        self._pending_writes = []
+        # LRU response cache for perplexity_query: normalized query ->
+        # (insert time, response). Repeated autonomous questions hit the
+        # cache instead of re-paying the full network round-trip.
+        self._pplx_cache = OrderedDict()
+        self._pplx_cache_size = 512
+        self._pplx_cache_ttl = 3600  # 1 hour
+        # Shared HTTP session (lazily created) so API calls reuse pooled
+        # connections instead of paying TLS/DNS setup per request
+        self._http = None
         self.init_database()
         self.load_memory()
-        
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get the persistent database connection, reconnecting if db_path changed"""
+        if self._conn is None or self._conn_path != self.db_path:
+            if self._conn is not None:
+                self._conn.close()
+            # One shared connection in autocommit mode - avoids per-call
+            # connect/commit/close overhead (a full fsync per write)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                         isolation_level=None)
+            if self.test_mode:
+                # Throwaway databases: skip the journal file and fsyncs
+                self._conn.execute("PRAGMA journal_mode=MEMORY")
+                self._conn.execute("PRAGMA synchronous=OFF")
+            else:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn_path = self.db_path
+        return self._conn
+
+    # Full schema as one script: a single parser pass and transaction
+    # instead of one execute() per table and index. Indexes keep
+    # pending-task and category lookups off full scans.
+    _SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS memory (
+        id INTEGER PRIMARY KEY,
+        key TEXT UNIQUE,
+        value BLOB,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        category TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS learning (
+        id INTEGER PRIMARY KEY,
+        input_data TEXT,
+        output_data TEXT,
+        success_score REAL,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY,
+        title TEXT,
+        description TEXT,
+        status TEXT DEFAULT 'pending',
+        priority INTEGER DEFAULT 5,
+        due_date DATETIME,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS integrations (
+        id INTEGER PRIMARY KEY,
+        service_name TEXT UNIQUE,
+        api_key TEXT,
+        endpoint TEXT,
+        status TEXT DEFAULT 'active'
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_tasks_status_prio
+    ON tasks(status, priority DESC, due_date ASC);
+
+    CREATE INDEX IF NOT EXISTS idx_memory_category_ts
+    ON memory(category, timestamp);
+    """
+
     def init_database(self):
         """Initialize SQLite database for persistent memory"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Memory table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS memory (
-            id INTEGER PRIMARY KEY,
-            key TEXT UNIQUE,
-            value TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            category TEXT
-        )
-        """)
-        
-        # Learning data
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS learning (
-            id INTEGER PRIMARY KEY,
-            input_data TEXT,
-            output_data TEXT,
-            success_score REAL,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # Tasks and reminders
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY,
-            title TEXT,
-            description TEXT,
-            status TEXT DEFAULT 'pending',
-            priority INTEGER DEFAULT 5,
-            due_date DATETIME,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # API integrations
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS integrations (
-            id INTEGER PRIMARY KEY,
-            service_name TEXT UNIQUE,
-            api_key TEXT,
-            endpoint TEXT,
-            status TEXT DEFAULT 'active'
-        )
-        """)
-        
-        conn.commit()
-        conn.close()
+        self._get_conn().executescript(self._SCHEMA_DDL)
         
+    @staticmethod
+    def _decode_value(value) -> Any:
+        """Decode a stored memory value (BLOB or legacy TEXT row)
+
+        The first-byte check keeps plain-string rows off the
+        exception-driven JSON path.
+        """
+        if isinstance(value, str):  # Legacy TEXT rows
+            value = value.encode()
+
+        if value and value[0] in _JSON_PREFIXES:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass  # Plain string that merely looks like JSON
+
+        return value.decode(errors='replace')
+
     def load_memory(self):
         """Load existing memory from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT key, value FROM memory")
-        for key, value in cursor.fetchall():
-            try:
-                self.memory[key] = json.loads(value)
-            except:
-                self.memory[key] = value
-                
-        conn.close()
-        
-    def save_memory(self, key: str, value: Any, category: str = "general"):
-        """Save data to persistent memory"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        value_json = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
-        
-        cursor.execute("""
-        INSERT OR REPLACE INTO memory (key, value, category) VALUES (?, ?, ?)
-        """, (key, value_json, category))
-        
-        conn.commit()
-        conn.close()
-        
+        # Stream rows straight off the cursor
+        for key, value in self._get_conn().execute("SELECT key, value FROM memory"):
+            self.memory[key] = self._decode_value(value)
+
+        self._memory_count = len(self.memory)
+        # Re-seed the recent-key window from the tail of the loaded rows
+        # so context-driven consumers (question triggers) survive restarts
+        self._recent_keys.extend(list(self.memory)[-self._recent_keys.maxlen:])
+
+    def get_memory(self, key: str) -> Any:
+        """Fetch and decode a single memory value from the database
+
+        Unlike load_memory() this touches one row, for callers that need
+        a specific key without hydrating the whole store.
+        """
+        row = self._get_conn().execute(
+            "SELECT value FROM memory WHERE key = ?", (key,)).fetchone()
+        return self._decode_value(row[0]) if row else None
+
+    @staticmethod
+    def _encode_value(value: Any) -> bytes:
+        """Encode a memory value for BLOB storage
+
+        orjson (C extension) for structured values, raw UTF-8 for plain
+        strings - no per-call encoder construction.
+        """
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, str):
+            return value.encode()
+        return orjson.dumps(value, default=str)
+
+    def save_memory(self, key: str, value: Any, category: str = "general",
+                    defer: bool = False):
+        """Save data to persistent memory
+
+        With defer=True the write is queued and persisted on the next
+        _flush() - used by the scheduler to coalesce frequent small writes.
+        """
+        value_json = self._encode_value(value)
+
+        if defer:
+            self._pending_writes.append((key, value_json, category))
+        else:
+            self._get_conn().execute(_SQL_SAVE_MEM, (key, value_json, category))
+
+        if key not in self.memory:
+            self._memory_count += 1
         self.memory[key] = value
-        
+        self._recent_keys.append(key)
+
+    def _persist_learning_batch(self, batch: List[tuple]):
+        """Write a batch of queued learning samples in one executemany"""
+        self._get_conn().executemany(_SQL_INSERT_LEARN, batch)
+
+    def _drain_learning_queue(self):
+        """Persist any queued learning samples immediately"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._learn_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        if batch:
+            self._persist_learning_batch(batch)
+
+    async def _learn_flusher(self):
+        """Background task that batches learning writes (up to 256 each)"""
+        while True:
+            batch = [await self._learn_queue.get()]
+            while len(batch) < 256:
+                try:
+                    batch.append(self._learn_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            self._persist_learning_batch(batch)
+
+    def _flush(self):
+        """Flush deferred memory writes in a single batch transaction"""
+        self._drain_learning_queue()
+
+        if not self._pending_writes:
+            return
+
+        batch, self._pending_writes = self._pending_writes, []
+        conn = self._get_conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_SQL_SAVE_MEM, batch)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
     def learn_from_interaction(self, input_data: str, output_data: str, success: float = 1.0):
         """Learn from user interactions"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-        INSERT INTO learning (input_data, output_data, success_score) VALUES (?, ?, ?)
-        """, (input_data, output_data, success))
-        
-        conn.commit()
-        conn.close()
-        
+        self._learn_queue.put_nowait((input_data, output_data, success))
+        self._record_learning(input_data, output_data, success)
+
+    def _record_learning(self, input_data: str, output_data: str, success: float):
+        """Mirror one learning sample into the in-memory ring and history"""
+        now = datetime.now()
+        idx = self._learning_count % self._learning_capacity
+        self._success[idx] = success
+        self._learning_ts[idx] = np.datetime64(now.replace(microsecond=0))
+        self._learning_count += 1
+
         self.learning_data.append({
             'input': input_data,
             'output': output_data,
             'success': success,
-            'timestamp': datetime.now()
+            'timestamp': now
         })
+
+    def bulk_seed(self, tasks: Optional[List[tuple]] = None,
+                  memory: Optional[Dict[str, tuple]] = None,
+                  learning: Optional[List[tuple]] = None) -> List[int]:
+        """Seed tasks, memory and learning rows in one transaction
+
+        Coalesces what would otherwise be one commit per row into a
+        single batch - used by tests and bootstrap scripts. Task rows
+        are (title, description, priority, due_date), memory maps
+        key -> (value, category), learning rows are (input, output,
+        score). Returns the ids of the tasks actually inserted.
+        """
+        conn = self._get_conn()
+        task_ids: List[int] = []
+        conn.execute("BEGIN")
+        try:
+            for title, description, priority, due_date in tasks or ():
+                cursor = conn.execute(_SQL_CREATE_TASK,
+                                      (title, description, priority, due_date))
+                task_ids.append(cursor.lastrowid)
+            if learning:
+                conn.executemany(_SQL_INSERT_LEARN, learning)
+            if memory:
+                conn.executemany(_SQL_SAVE_MEM,
+                                 [(key, self._encode_value(value), category)
+                                  for key, (value, category) in memory.items()])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        # Keep the in-memory mirrors in step with what was written
+        for key, (value, _category) in (memory or {}).items():
+            if key not in self.memory:
+                self._memory_count += 1
+            self.memory[key] = value
+            self._recent_keys.append(key)
+        for input_data, output_data, success in learning or ():
+            self._record_learning(input_data, output_data, success)
+
+        return task_ids
+
+    def _learning_view(self):
+        """Success scores and timestamps in insertion order"""
+        n = self._learning_count
+        if n <= self._learning_capacity:
+            return self._success[:n], self._learning_ts[:n]
+        i = n % self._learning_capacity
+        return (np.concatenate((self._success[i:], self._success[:i])),
+                np.concatenate((self._learning_ts[i:], self._learning_ts[:i])))
+
+    def recent_success_stats(self, days: int = 7) -> tuple:
+        """Get (sample count, mean success score) for the last N days"""
+        success, timestamps = self._learning_view()
+        if success.size == 0:
+            return 0, 0.0
+
+        mask = timestamps > np.datetime64(datetime.now() - timedelta(days=days))
+        count = int(mask.sum())
+        rate = float(success[mask].mean()) if count else 0.0
+        return count, rate
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
         
     async def perplexity_query(self, query: str) -> str:
         """Query Perplexity API"""
         if 'perplexity' not in self.api_keys:
             return "Perplexity API key not configured"
-            
+
+        # Check the response cache first - exact match on normalized query
+        cache_key = query.strip().lower()
+        cached = self._pplx_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_response = cached
+            if time.time() - cached_at < self._pplx_cache_ttl:
+                self._pplx_cache.move_to_end(cache_key)
+                return cached_response
+            del self._pplx_cache[cache_key]
+
         headers = {
             'Authorization': f'Bearer {self.api_keys["perplexity"]}',
             'Content-Type': 'application/json'
@@ -166,11 +402,19 @@ class RandyAI:
         }
         
         try:
-            response = requests.post('https://api.perplexity.ai/chat/completions', 
-                                   headers=headers, json=data)
-            return response.json()['choices'][0]['message']['content']
+            session = await self._get_http()
+            async with session.post('https://api.perplexity.ai/chat/completions',
+                                    headers=headers, json=data) as response:
+                result = await response.json()
+            content = result['choices'][0]['message']['content']
         except Exception as e:
             return f"Error: {str(e)}"
+
+        self._pplx_cache[cache_key] = (time.time(), content)
+        if len(self._pplx_cache) > self._pplx_cache_size:
+            self._pplx_cache.popitem(last=False)  # Evict least recently used
+
+        return content
             
     async def abacus_integration(self, data: Dict) -> str:
         """Integrate with Abacus.AI"""
@@ -180,90 +424,138 @@ class RandyAI:
         # Implementation for Abacus.AI integration
         return "Abacus integration executed"
         
-    def create_task(self, title: str, description: str = "", priority: int = 5, 
-                   due_date: Optional[datetime] = None):
-        """Create a new task"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-        INSERT INTO tasks (title, description, priority, due_date) VALUES (?, ?, ?, ?)
-        """, (title, description, priority, due_date))
-        
-        task_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return task_id
-        
-    def get_pending_tasks(self) -> List[Dict]:
-        """Get all pending tasks"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-        SELECT id, title, description, priority, due_date, created_at 
-        FROM tasks WHERE status = 'pending' ORDER BY priority DESC, due_date ASC
-        """)
-        
-        tasks = []
-        for row in cursor.fetchall():
-            tasks.append({
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'priority': row[3],
-                'due_date': row[4],
-                'created_at': row[5]
-            })
-            
-        conn.close()
-        return tasks
-        
+    def create_task(self, title: str, description: str = "", priority: int = 5,
+                   due_date: Optional[datetime] = None, dedupe: bool = False):
+        """Create a new task
+
+        Direct creates always insert. Scheduler jobs pass dedupe=True so
+        a double-fired job (e.g. after a restart) is dropped when the
+        same title was created within the last hour - those calls return
+        None instead of a task id.
+        """
+        if dedupe:
+            idem_key = f"{title}|{datetime.now().date()}"
+            now = time.monotonic()
+            if now < self._task_idem.get(idem_key, 0):
+                return None
+            # Sweep expired entries occasionally so long-running
+            # instances don't accumulate one entry per title per day
+            if len(self._task_idem) > 256:
+                self._task_idem = {k: v for k, v in self._task_idem.items()
+                                   if v > now}
+            self._task_idem[idem_key] = now + 3600
+
+        cursor = self._get_conn().execute(
+            _SQL_CREATE_TASK, (title, description, priority, due_date))
+        return cursor.lastrowid
+
+    _TASK_COLUMNS = ('id', 'title', 'description', 'priority', 'due_date', 'created_at')
+
+    def get_pending_tasks(self, limit: Optional[int] = None,
+                          min_priority: Optional[int] = None) -> List[Dict]:
+        """Get pending tasks, optionally filtered and limited in SQL"""
+        query = """
+        SELECT id, title, description, priority, due_date, created_at
+        FROM tasks WHERE status = 'pending'
+        """
+        params = []
+
+        if min_priority is not None:
+            query += " AND priority >= ?"
+            params.append(min_priority)
+
+        query += " ORDER BY priority DESC, due_date ASC"
+
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        rows = self._get_conn().execute(query, params).fetchall()
+        return [dict(zip(self._TASK_COLUMNS, row)) for row in rows]
+
+    def get_urgent_tasks(self) -> List[Dict]:
+        """Get pending tasks that need immediate attention (priority >= 9)"""
+        rows = self._get_conn().execute("""
+        SELECT id, title, description, priority, due_date, created_at
+        FROM tasks WHERE status = 'pending' AND priority >= 9
+        ORDER BY priority DESC, due_date ASC LIMIT 32
+        """).fetchall()
+        return [dict(zip(self._TASK_COLUMNS, row)) for row in rows]
+        
+    def recent_memory(self, n: int = 10) -> Dict[str, Any]:
+        """The n most recently inserted memory items, in insertion order
+
+        Walks the dict from its tail instead of materializing every item.
+        """
+        tail = list(islice(reversed(self.memory.items()), n))
+        return dict(reversed(tail))
+
+    def cleanup_old_memory(self, days: int = 90,
+                           keep_categories: Tuple[str, ...] = ('reports', 'self_improvement')) -> int:
+        """Bulk-delete memory older than N days, keeping important categories
+
+        Runs as one indexed DELETE instead of per-row Python iteration.
+        Returns the number of rows removed.
+        """
+        # Match CURRENT_TIMESTAMP's UTC 'YYYY-MM-DD HH:MM:SS' format
+        cutoff = (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+        placeholders = ", ".join("?" * len(keep_categories))
+        where = f"timestamp < ? AND category NOT IN ({placeholders})"
+        params = (cutoff, *keep_categories)
+
+        conn = self._get_conn()
+        stale_keys = [row[0] for row in
+                      conn.execute(f"SELECT key FROM memory WHERE {where}", params)]
+        if not stale_keys:
+            return 0
+
+        cursor = conn.execute(f"DELETE FROM memory WHERE {where}", params)
+
+        for key in stale_keys:
+            self.memory.pop(key, None)
+        self._memory_count = len(self.memory)
+
+        return cursor.rowcount
+
     def daily_update(self) -> str:
         """Generate daily update report"""
-        pending_tasks = self.get_pending_tasks()
-        
-        report = f"Daily Update - {datetime.now().strftime('%Y-%m-%d')}\n"
-        report += "=" * 40 + "\n\n"
-        
-        # Task summary
-        report += f"Pending Tasks: {len(pending_tasks)}\n"
-        
-        # Recent learning
-        recent_learning = len([l for l in self.learning_data 
-                             if (datetime.now() - l['timestamp']).days < 1])
-        report += f"New Learning Items: {recent_learning}\n"
-        
-        # Memory usage
-        report += f"Memory Items: {len(self.memory)}\n\n"
-        
-        # High priority tasks
-        high_priority = [t for t in pending_tasks if t['priority'] >= 8]
+        # Count in SQL rather than fetching every pending row
+        pending_count = self._get_conn().execute(
+            "SELECT COUNT(*) FROM tasks WHERE status = 'pending'").fetchone()[0]
+
+        recent_learning, _ = self.recent_success_stats(days=1)
+
+        # Assemble once via join instead of repeated string concatenation
+        parts = [
+            f"Daily Update - {datetime.now().strftime('%Y-%m-%d')}\n",
+            "=" * 40, "\n\n",
+            f"Pending Tasks: {pending_count}\n",
+            f"New Learning Items: {recent_learning}\n",
+            f"Memory Items: {self._memory_count}\n\n",
+        ]
+
+        # High priority tasks - filtered and limited in SQL
+        high_priority = self.get_pending_tasks(limit=3, min_priority=8)
         if high_priority:
-            report += "High Priority Tasks:\n"
-            for task in high_priority[:3]:
-                report += f"- {task['title']}\n"
-            report += "\n"
-            
-        return report
+            parts.append("High Priority Tasks:\n")
+            parts.extend(f"- {task['title']}\n" for task in high_priority)
+            parts.append("\n")
+
+        return "".join(parts)
         
     async def autonomous_operation(self):
         """Main autonomous operation loop"""
         while True:
             try:
-                # Check for due tasks
-                tasks = self.get_pending_tasks()
-                
-                # Process high priority items
-                for task in tasks:
-                    if task['priority'] >= 9:
-                        await self.process_urgent_task(task)
+                # Process high priority items - filtered in SQL
+                for task in self.get_urgent_tasks():
+                    await self.process_urgent_task(task)
                         
-                # Daily update check
-                if datetime.now().hour == 9 and datetime.now().minute < 5:
+                # Daily update check - one clock read per tick
+                now = datetime.now()
+                if now.hour == 9 and now.minute < 5:
                     update = self.daily_update()
-                    self.save_memory(f"daily_update_{datetime.now().strftime('%Y%m%d')}", 
+                    self.save_memory(f"daily_update_{now.strftime('%Y%m%d')}",
                                    update, "reports")
                     
                 # Learn from patterns
@@ -289,11 +581,11 @@ class RandyAI:
     def get_status(self) -> Dict:
         """Get current system status"""
         return {
-            'memory_items': len(self.memory),
+            'memory_items': self._memory_count,
             'learning_items': len(self.learning_data),
             'pending_tasks': len(self.get_pending_tasks()),
             'last_update': datetime.now().isoformat(),
-            'preferences': self.preferences.__dict__
+            'preferences': orjson.loads(self._prefs_snapshot)
         }
 
 # Initialize and start the AI
@@ -5,20 +5,52 @@ Connects RandyAI to Perplexity, Abacus.AI, DeepAgent, and other services
 """
 
 import asyncio
-import json
-import aiohttp
+import hashlib
+import random
+import time
+import httpx
+import orjson
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+# Transient statuses worth retrying - rate limits and server-side errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Constant portion of every space config; merged into the per-space dict
+# instead of re-spelling the literals on each call
+_SPACE_TEMPLATE = {
+    "owner": "Randy Jordan",
+    "memory_access": True,
+    "learning_enabled": True
+}
+
+def _write_handoff(filename: str, package: Dict) -> int:
+    """Serialize and write a handoff package, returning the byte count
+
+    Runs in a worker thread. Serializes exactly once and measures size
+    via the file handle, so the encoded bytes never outlive the write.
+    """
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(package, option=orjson.OPT_INDENT_2))
+        return f.tell()
+
+@dataclass(slots=True)
 class APIConfig:
-    """API Configuration for each service"""
+    """API Configuration for each service
+
+    Slotted: no per-instance __dict__ means smaller objects and a
+    faster attribute path on the per-request header lookups.
+    """
     name: str
     endpoint: str
     key: str
     headers: Dict[str, str]
     active: bool = True
+    # headers with the {key} placeholder filled in, built once when the
+    # key is configured so per-call sends reuse the same dict object
+    rendered_headers: Dict[str, str] = field(default_factory=dict)
 
 class MultiPlatformIntegrator:
     """Manages connections to multiple AI platforms"""
@@ -27,73 +59,188 @@ class MultiPlatformIntegrator:
         self.randy_ai = randy_ai_instance
         self.apis = {}
         self.session = None
+        self._session_lock = asyncio.Lock()
+        # Prompt -> response LRU with TTL; identical prompts short-circuit
+        # to a dict lookup instead of a paid remote call. Reloaded from
+        # memory so cache hits survive restarts.
+        self._cache = OrderedDict()
+        self._cache_ttl = 3600  # 1 hour
+        self._cache_size = 256
+        saved_cache = self.randy_ai.memory.get("llm_cache")
+        if isinstance(saved_cache, dict):
+            self._cache.update(saved_cache)
         self.setup_apis()
+        # Built lazily in get_integration_status, cleared on reconfigure
+        self._status_cache = None
+        # Platforms that are active and have a key - hot dispatch paths
+        # test membership here instead of re-checking APIConfig fields
+        self._ready = frozenset()
+        # Per-platform concurrency caps so one slow platform can't starve
+        # the others during fan-out queries
+        self._sem = {name: asyncio.Semaphore(8) for name in self.apis}
+
+    @staticmethod
+    def _cache_key(model: str, system: str, prompt: str) -> str:
+        """Stable digest for a (model, system prompt, user prompt) triple"""
+        return hashlib.blake2b(f"{model}|{system}|{prompt}".encode(),
+                               digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Return the cached response for key, or None if absent/expired"""
+        hit = self._cache.get(key)
+        if hit is None:
+            return None
+
+        cached_at, result = hit
+        if time.time() - cached_at >= self._cache_ttl:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: str, result: Dict):
+        """Store a successful response, evicting the oldest on overflow"""
+        self._cache[key] = (time.time(), result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
         
     def setup_apis(self):
         """Configure API endpoints"""
         # Perplexity Configuration
+        # Shared headers live on the client session (see init_session);
+        # per-API templates carry only the credential header
         self.apis['perplexity'] = APIConfig(
             name="Perplexity",
             endpoint="https://api.perplexity.ai/chat/completions",
             key="",  # To be configured
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer {key}"
-            }
+            headers={"Authorization": "Bearer {key}"}
         )
-        
+
         # Abacus.AI Configuration
         self.apis['abacus'] = APIConfig(
             name="Abacus.AI",
             endpoint="https://routellm.abacus.ai/v1/chat/completions",
             key="",  # To be configured
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer {key}"
-            }
+            headers={"Authorization": "Bearer {key}"}
         )
-        
+
         # DeepAgent Configuration
         self.apis['deepagent'] = APIConfig(
             name="DeepAgent",
             endpoint="https://api.deepagent.ai/v1/completions",
             key="",  # To be configured
-            headers={
-                "Content-Type": "application/json",
-                "X-API-Key": "{key}"
-            }
+            headers={"X-API-Key": "{key}"}
         )
         
+    async def __aenter__(self):
+        """Bootstrap the HTTP client once at startup
+
+        Entering the integrator as a context manager lets the query
+        methods assume a live session instead of re-checking per call.
+        """
+        await self.init_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close_session()
+
     async def init_session(self):
-        """Initialize HTTP session"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-            
+        """Initialize the shared HTTP client (idempotent, race-safe)"""
+        if self.session is None or self.session.is_closed:
+            async with self._session_lock:
+                if self.session is not None and not self.session.is_closed:
+                    return  # Another coroutine won the race
+
+                # All traffic goes to the same few HTTPS hosts; HTTP/2
+                # multiplexes concurrent fan-out calls over one warm TLS
+                # connection per host instead of a socket per request
+                self.session = httpx.AsyncClient(
+                    http2=True,
+                    # Common headers set once here; per-call dicts carry
+                    # only the credential header for the target API
+                    headers={
+                        "Content-Type": "application/json",
+                        "Accept": "application/json",
+                        "User-Agent": "RandyAI/1.0"
+                    },
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=50,
+                        keepalive_expiry=75
+                    )
+                )
+
     async def close_session(self):
-        """Close HTTP session"""
+        """Close HTTP client and persist the response cache"""
+        if self._cache:
+            self.randy_ai.save_memory("llm_cache", dict(self._cache), "cache", defer=True)
+        # Shutdown barrier: push every deferred write out in one batch
+        self.randy_ai._flush()
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
             
     def configure_api(self, service: str, api_key: str):
         """Configure API key for a service"""
         if service in self.apis:
-            self.apis[service].key = api_key
+            api = self.apis[service]
+            api.key = api_key
+            api.rendered_headers = {name: template.format(key=api_key)
+                                    for name, template in api.headers.items()}
+            self._status_cache = None
+            self._ready = frozenset(n for n, a in self.apis.items()
+                                    if a.active and a.key)
             self.randy_ai.save_memory(f"api_key_{service}", api_key, "credentials")
             return True
         return False
         
+    async def _post_with_retry(self, url: str, *, headers: Optional[Dict] = None,
+                               json: Optional[Dict] = None,
+                               max_attempts: int = 4) -> httpx.Response:
+        """POST with exponential backoff + jitter on transient failures
+
+        Retries connection/timeout errors and 429/5xx responses, honoring
+        Retry-After when the server sends one.
+        """
+        assert self.session is not None, "integrator used outside its context manager"
+        delay_base, delay_cap = 0.5, 8.0
+
+        for attempt in range(max_attempts):
+            last_attempt = attempt == max_attempts - 1
+            retry_after = None
+
+            try:
+                response = await self.session.post(url, headers=headers, json=json)
+            except (httpx.TransportError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES or last_attempt:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+
+            delay = min(delay_cap, delay_base * 2 ** attempt) * random.uniform(0.5, 1.5)
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+            await asyncio.sleep(delay)
+
     async def query_perplexity(self, prompt: str, context: str = "") -> Dict:
         """Query Perplexity API with context"""
-        await self.init_session()
-        
         if not self.apis['perplexity'].key:
             return {"error": "Perplexity API key not configured"}
-            
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.apis['perplexity'].key}"
-        }
-        
+
+        cache_key = self._cache_key("llama-3.1-sonar-large-128k-online", context, prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        headers = self.apis['perplexity'].rendered_headers
+
         data = {
             "model": "llama-3.1-sonar-large-128k-online",
             "messages": [
@@ -105,29 +252,33 @@ class MultiPlatformIntegrator:
         }
         
         try:
-            async with self.session.post(self.apis['perplexity'].endpoint, 
-                                       headers=headers, json=data) as response:
-                result = await response.json()
-                return {
-                    "success": True,
-                    "response": result['choices'][0]['message']['content'],
-                    "tokens_used": result.get('usage', {})
-                }
+            async with self._sem['perplexity']:
+                response = await self._post_with_retry(self.apis['perplexity'].endpoint,
+                                                       headers=headers, json=data)
+            result = orjson.loads(response.content)
+            payload = {
+                "success": True,
+                "response": result['choices'][0]['message']['content'],
+                "tokens_used": result.get('usage', {})
+            }
+            self._cache_put(cache_key, payload)
+            return payload
         except Exception as e:
             return {"error": f"Perplexity API error: {str(e)}"}
             
     async def send_to_abacus(self, data: Dict, project_type: str = "general") -> Dict:
         """Send data to Abacus.AI for processing"""
-        await self.init_session()
-        
         if not self.apis['abacus'].key:
             return {"error": "Abacus API key not configured"}
-            
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.apis['abacus'].key}"
-        }
-        
+
+        cache_key = self._cache_key("deepseek-r1", project_type,
+                                    orjson.dumps(data, option=orjson.OPT_SORT_KEYS).decode())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        headers = self.apis['abacus'].rendered_headers
+
         payload = {
             "model": "deepseek-r1",
             "messages": [
@@ -135,50 +286,57 @@ class MultiPlatformIntegrator:
                     "role": "system", 
                     "content": f"Process this data for Randy's {project_type} project"
                 },
-                {"role": "user", "content": json.dumps(data)}
+                {"role": "user", "content": orjson.dumps(data).decode()}
             ],
             "stream": False
         }
         
         try:
-            async with self.session.post(self.apis['abacus'].endpoint,
-                                       headers=headers, json=payload) as response:
-                result = await response.json()
-                return {
-                    "success": True,
-                    "processed_data": result['choices'][0]['message']['content'],
-                    "timestamp": datetime.now().isoformat()
-                }
+            async with self._sem['abacus']:
+                response = await self._post_with_retry(self.apis['abacus'].endpoint,
+                                                       headers=headers, json=payload)
+            result = orjson.loads(response.content)
+            payload = {
+                "success": True,
+                "processed_data": result['choices'][0]['message']['content'],
+                "timestamp": datetime.now().isoformat()
+            }
+            self._cache_put(cache_key, payload)
+            return payload
         except Exception as e:
             return {"error": f"Abacus API error: {str(e)}"}
             
     async def handoff_to_deepagent(self, project_data: Dict, instructions: str) -> Dict:
         """Handoff project to DeepAgent for development"""
+        # One clock read per handoff - both the timestamp and filename derive from it
+        now = datetime.now()
         handoff_package = {
             "project_name": project_data.get("name", "RandyAI_Project"),
             "description": project_data.get("description", ""),
             "code_base": project_data.get("code", ""),
             "requirements": project_data.get("requirements", []),
             "instructions": instructions,
-            "user_preferences": self.randy_ai.preferences.__dict__,
-            "memory_context": dict(list(self.randy_ai.memory.items())[-10:]),  # Last 10 items
-            "timestamp": datetime.now().isoformat(),
+            "user_preferences": orjson.loads(self.randy_ai._prefs_snapshot),
+            "memory_context": self.randy_ai.recent_memory(10),
+            "timestamp": now.isoformat(),
             "handoff_type": "development_continuation"
         }
-        
+
         # Save handoff locally
-        filename = f"handoff_{project_data.get('name', 'project')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"handoff_{project_data.get('name', 'project')}_{now:%Y%m%d_%H%M%S}.json"
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(handoff_package, f, indent=2)
-                
-            self.randy_ai.save_memory(f"handoff_{filename}", handoff_package, "handoffs")
-            
+            # Serializing + writing a large package would stall the event
+            # loop; hand it to a worker thread instead
+            package_size = await asyncio.to_thread(_write_handoff, filename, handoff_package)
+
+            self.randy_ai.save_memory(f"handoff_{filename}", handoff_package,
+                                      "handoffs", defer=True)
+
             return {
                 "success": True,
                 "handoff_file": filename,
-                "package_size": len(json.dumps(handoff_package)),
+                "package_size": package_size,
                 "instructions": f"Project handed off to DeepAgent. File: {filename}"
             }
         except Exception as e:
@@ -197,26 +355,28 @@ class MultiPlatformIntegrator:
         """Send query to multiple platforms and combine results"""
         if platforms is None:
             platforms = ['perplexity', 'abacus']
-            
-        results = {}
-        
-        tasks = []
+
+        # Keyed by platform name so results stay correctly labeled even
+        # when an unconfigured platform is skipped
+        named = {}
         for platform in platforms:
-            if platform == 'perplexity' and self.apis['perplexity'].key:
-                tasks.append(self.query_perplexity(query))
-            elif platform == 'abacus' and self.apis['abacus'].key:
-                tasks.append(self.send_to_abacus({"query": query}, "multi_query"))
-                
-        if tasks:
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for i, response in enumerate(responses):
-                platform = platforms[i] if i < len(platforms) else f"platform_{i}"
+            if platform not in self._ready:
+                continue
+            if platform == 'perplexity':
+                named['perplexity'] = self.query_perplexity(query)
+            elif platform == 'abacus':
+                named['abacus'] = self.send_to_abacus({"query": query}, "multi_query")
+
+        results = {}
+        if named:
+            responses = await asyncio.gather(*named.values(), return_exceptions=True)
+
+            for platform, response in zip(named.keys(), responses):
                 if isinstance(response, Exception):
                     results[platform] = {"error": str(response)}
                 else:
                     results[platform] = response
-                    
+
         return {
             "query": query,
             "platforms_queried": platforms,
@@ -227,37 +387,35 @@ class MultiPlatformIntegrator:
     def create_space_config(self, space_name: str, personality: str, purpose: str) -> Dict:
         """Create configuration for a new AI space"""
         config = {
+            **_SPACE_TEMPLATE,
             "name": space_name,
             "personality": personality,
             "purpose": purpose,
-            "owner": "Randy Jordan",
             "created": datetime.now().isoformat(),
             "preferences": {
                 "tone": self.randy_ai.preferences.tone_preference,
                 "code_limit": self.randy_ai.preferences.code_limit,
                 "location_context": self.randy_ai.preferences.location
-            },
-            "memory_access": True,
-            "learning_enabled": True
+            }
         }
         
-        self.randy_ai.save_memory(f"space_config_{space_name}", config, "spaces")
+        self.randy_ai.save_memory(f"space_config_{space_name}", config, "spaces",
+                                  defer=True)
         return config
         
     async def autonomous_platform_check(self):
         """Autonomously check all platforms for updates"""
-        check_results = {}
-        
-        for platform_name, api_config in self.apis.items():
-            if api_config.active and api_config.key:
-                try:
-                    # Simple health check
-                    status = await self.platform_health_check(platform_name)
-                    check_results[platform_name] = status
-                except Exception as e:
-                    check_results[platform_name] = {"error": str(e)}
-                    
-        return check_results
+        # Probe every configured platform concurrently instead of paying
+        # N sequential round-trips; cap each probe at 10s
+        names = sorted(self._ready)
+        probes = [asyncio.wait_for(self.platform_health_check(name), timeout=10)
+                  for name in names]
+
+        responses = await asyncio.gather(*probes, return_exceptions=True)
+
+        return {name: (response if not isinstance(response, Exception)
+                       else {"error": str(response)})
+                for name, response in zip(names, responses)}
         
     async def platform_health_check(self, platform: str) -> Dict:
         """Check if platform is accessible"""
@@ -268,15 +426,21 @@ class MultiPlatformIntegrator:
         }
         
     def get_integration_status(self) -> Dict:
-        """Get status of all integrations"""
-        status = {}
-        for name, api in self.apis.items():
-            status[name] = {
-                "configured": bool(api.key),
-                "active": api.active,
-                "endpoint": api.endpoint
+        """Get status of all integrations
+
+        The snapshot only changes when a key is configured, so it is
+        built once and reused until configure_api invalidates it.
+        """
+        if self._status_cache is None:
+            self._status_cache = {
+                name: {
+                    "configured": bool(api.key),
+                    "active": api.active,
+                    "endpoint": api.endpoint
+                }
+                for name, api in self.apis.items()
             }
-        return status
+        return self._status_cache
 
 # Integration with main RandyAI class
 class EnhancedRandyAI:
@@ -305,30 +469,42 @@ class EnhancedRandyAI:
             
     def process_multi_platform_results(self, results: Dict) -> str:
         """Process and combine results from multiple platforms"""
-        combined = "Multi-Platform AI Response:\n\n"
-        
+        # Collect parts and join once - no quadratic string reallocation
+        parts = ["Multi-Platform AI Response:\n\n"]
+
         for platform, result in results.get('results', {}).items():
             if 'error' not in result:
                 response_text = result.get('response', result.get('processed_data', ''))
-                combined += f"{platform.title()} Response:\n{response_text}\n\n"
-                
-        return combined
+                parts.append(f"{platform.title()} Response:\n{response_text}\n\n")
+
+        return "".join(parts)
         
     async def start_autonomous_mode(self):
         """Start autonomous operation with multi-platform integration"""
+        base_interval = 600  # 10 minutes
+        max_interval = 3600
+        sleep_for = base_interval
+
         while True:
-            try:
-                # Check platform status
-                await self.integrator.autonomous_platform_check()
-                
-                # Run base AI autonomous operations
-                await self.base_ai.pattern_analysis()
-                
-                # Check for pending handoffs
-                # Implementation for checking and processing handoffs
-                
-                await asyncio.sleep(600)  # 10 minutes
-                
-            except Exception as e:
-                self.base_ai.save_memory("integration_error", str(e), "errors")
-                await asyncio.sleep(300)  # 5 minutes on error
\ No newline at end of file
+            # Run the cycle's subtasks together; one failure is logged
+            # rather than killing the whole loop
+            check_results, analysis = await asyncio.gather(
+                self.integrator.autonomous_platform_check(),
+                self.base_ai.pattern_analysis(),
+                return_exceptions=True
+            )
+
+            for result in (check_results, analysis):
+                if isinstance(result, Exception):
+                    self.base_ai.save_memory("integration_error", str(result),
+                                             "errors", defer=True)
+
+            # Check for pending handoffs
+            # Implementation for checking and processing handoffs
+
+            # Adaptive cadence: back off while no platform reported
+            # anything, snap back to the base interval on real activity
+            did_work = bool(check_results) and not isinstance(check_results, Exception)
+            sleep_for = base_interval if did_work else min(sleep_for * 2, max_interval)
+
+            await asyncio.sleep(sleep_for)
\ No newline at end of file
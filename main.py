@@ -13,30 +13,42 @@ Usage:
 
 import asyncio
 import argparse
+import functools
 import json
 from datetime import datetime
 import sys
 from pathlib import Path
 
-# Import our modules
+# Heavy modules (core AI, integrations, scheduler) are imported lazily inside
+# the cached properties below so trivial commands like --welcome stay fast
 sys.path.append(str(Path(__file__).parent))
-from core.randy_ai import RandyAI
-from integrations.multi_platform import EnhancedRandyAI, MultiPlatformIntegrator
-from autonomous.scheduler import AutonomousScheduler, QuestionGenerator
 
 class RandyAISystem:
     """Main RandyAI system controller"""
-    
+
     def __init__(self):
         print("🤖 Initializing RandyAI Personal Assistant...")
-        
-        # Initialize core components
-        self.core_ai = RandyAI()
-        self.enhanced_ai = EnhancedRandyAI(self.core_ai)
-        self.scheduler = AutonomousScheduler(self.core_ai)
-        self.question_gen = QuestionGenerator(self.core_ai)
-        
         print("✅ RandyAI System Initialized")
+
+    @functools.cached_property
+    def core_ai(self):
+        from core.randy_ai import RandyAI
+        return RandyAI()
+
+    @functools.cached_property
+    def enhanced_ai(self):
+        from integrations.multi_platform import EnhancedRandyAI
+        return EnhancedRandyAI(self.core_ai)
+
+    @functools.cached_property
+    def scheduler(self):
+        from autonomous.scheduler import AutonomousScheduler
+        return AutonomousScheduler(self.core_ai)
+
+    @functools.cached_property
+    def question_gen(self):
+        from autonomous.scheduler import QuestionGenerator
+        return QuestionGenerator(self.core_ai)
         
     def configure_apis(self):
         """Interactive API configuration"""
@@ -101,10 +113,16 @@ class RandyAISystem:
         print("\n💬 Interactive Mode - Chat with RandyAI")
         print("Type 'exit' to quit, 'status' for system status, 'help' for commands")
         print("="*60)
-        
+
+        async with self.enhanced_ai.integrator:
+            await self._interactive_loop()
+
+    async def _interactive_loop(self):
         while True:
             try:
-                user_input = input("\nYou: ").strip()
+                # Read input off-loop so background coroutines (scheduler,
+                # autonomous checks) keep running while the prompt is idle
+                user_input = (await asyncio.to_thread(input, "\nYou: ")).strip()
                 
                 if user_input.lower() == 'exit':
                     break
@@ -225,21 +243,24 @@ class RandyAISystem:
     async def start_autonomous_mode(self):
         """Start full autonomous operation"""
         print("\n🚀 Starting Autonomous Mode...")
-        
-        # Start all autonomous components
-        tasks = [
-            self.scheduler.start_autonomous_scheduler(),
-            self.question_gen.autonomous_question_cycle(),
-            self.enhanced_ai.start_autonomous_mode()
-        ]
-        
-        try:
-            await asyncio.gather(*tasks)
-        except KeyboardInterrupt:
-            print("\n🛑 Stopping autonomous mode...")
-            self.scheduler.stop_scheduler()
-        except Exception as e:
-            print(f"\n❌ Autonomous mode error: {str(e)}")
+
+        # Bootstrap the shared HTTP client once; every component below can
+        # then assume a live session for the lifetime of the run
+        async with self.enhanced_ai.integrator:
+            tasks = [
+                self.scheduler.start_autonomous_scheduler(),
+                self.question_gen.autonomous_question_cycle(),
+                self.enhanced_ai.start_autonomous_mode(),
+                self.core_ai._learn_flusher()
+            ]
+
+            try:
+                await asyncio.gather(*tasks)
+            except KeyboardInterrupt:
+                print("\n🛑 Stopping autonomous mode...")
+                self.scheduler.stop_scheduler()
+            except Exception as e:
+                print(f"\n❌ Autonomous mode error: {str(e)}")
             
     def force_daily_update(self):
         """Force generate daily update"""
@@ -6,8 +6,14 @@ Comprehensive testing for all components
 
 import unittest
 import asyncio
+import atexit
+from unittest import mock
+import shutil
 import tempfile
 import os
+
+import pytest
+from freezegun import freeze_time
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
@@ -15,31 +21,45 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.randy_ai import RandyAI, UserPreferences
-from integrations.multi_platform import MultiPlatformIntegrator, EnhancedRandyAI
-from autonomous.scheduler import AutonomousScheduler, QuestionGenerator
+# Component imports happen inside each setUp so xdist workers that run
+# only a subset of the classes skip the modules they never touch
+
+# Schema-initialized database template, built once per process. setUp
+# copies it into place instead of re-running the DDL for every test.
+_TEMPLATE_DB = None
+
+def _fresh_test_db(dest_path):
+    """Copy the schema template to dest_path, building it on first use"""
+    from core.randy_ai import RandyAI
+
+    global _TEMPLATE_DB
+    if _TEMPLATE_DB is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        template_ai = RandyAI(Path(path), test_mode=True)
+        # Close so any journal state lands in the main file before copying
+        template_ai._conn.close()
+        template_ai._conn = None
+        _TEMPLATE_DB = path
+        atexit.register(os.remove, path)
+    shutil.copyfile(_TEMPLATE_DB, dest_path)
+
+class RandyAIDbMixin:
+    """Shared in-memory RandyAI setup for the unit-test classes
+
+    Nothing in these tests needs to survive the test, so the database
+    lives in RAM and there is no file to clean up afterwards.
+    """
 
-class TestRandyAICore(unittest.TestCase):
-    """Test core RandyAI functionality"""
-    
     def setUp(self):
-        """Set up test environment"""
-        # Use temporary database for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, "test_randy_ai.db")
-        
-        # Create RandyAI instance with test database
-        self.randy_ai = RandyAI()
-        self.randy_ai.db_path = Path(self.test_db_path)
-        self.randy_ai.init_database()
-        
-    def tearDown(self):
-        """Clean up test environment"""
-        # Remove test database
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        os.rmdir(self.temp_dir)
-        
+        super().setUp()
+        from core.randy_ai import RandyAI
+
+        self.randy_ai = RandyAI(":memory:", test_mode=True)
+
+class TestRandyAICore(RandyAIDbMixin, unittest.TestCase):
+    """Test core RandyAI functionality"""
+
     def test_user_preferences_initialization(self):
         """Test user preferences are correctly initialized"""
         prefs = self.randy_ai.preferences
@@ -86,6 +106,7 @@ class TestRandyAICore(unittest.TestCase):
         self.assertEqual(latest_learning['output'], output_data)
         self.assertEqual(latest_learning['success'], success_score)
         
+    @freeze_time("2024-01-01 12:00:00")
     def test_task_management(self):
         """Test task creation and retrieval"""
         task_title = "Test Task"
@@ -109,11 +130,13 @@ class TestRandyAICore(unittest.TestCase):
         
     def test_daily_update_generation(self):
         """Test daily update report generation"""
-        # Add some test data
-        self.randy_ai.create_task("Test Task 1", "Description 1", 8)
-        self.randy_ai.create_task("Test Task 2", "Description 2", 6)
-        self.randy_ai.learn_from_interaction("input1", "output1", 0.9)
-        self.randy_ai.save_memory("test_key1", "test_value1", "test")
+        # Add some test data in one transaction
+        self.randy_ai.bulk_seed(
+            tasks=[("Test Task 1", "Description 1", 8, None),
+                   ("Test Task 2", "Description 2", 6, None)],
+            memory={"test_key1": ("test_value1", "test")},
+            learning=[("input1", "output1", 0.9)]
+        )
         
         # Generate update
         update = self.randy_ai.daily_update()
@@ -134,26 +157,16 @@ class TestRandyAICore(unittest.TestCase):
         self.assertIn('last_update', status)
         self.assertIn('preferences', status)
         
-class TestMultiPlatformIntegrator(unittest.TestCase):
+class TestMultiPlatformIntegrator(RandyAIDbMixin, unittest.IsolatedAsyncioTestCase):
     """Test multi-platform integration functionality"""
-    
+
     def setUp(self):
         """Set up test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, "test_integrator.db")
-        
-        self.randy_ai = RandyAI()
-        self.randy_ai.db_path = Path(self.test_db_path)
-        self.randy_ai.init_database()
-        
+        super().setUp()
+        from integrations.multi_platform import MultiPlatformIntegrator
+
         self.integrator = MultiPlatformIntegrator(self.randy_ai)
-        
-    def tearDown(self):
-        """Clean up test environment"""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        os.rmdir(self.temp_dir)
-        
+
     def test_api_configuration(self):
         """Test API configuration"""
         test_key = "test_api_key_12345"
@@ -169,7 +182,7 @@ class TestMultiPlatformIntegrator(unittest.TestCase):
         result = self.integrator.configure_api('invalid_service', test_key)
         self.assertFalse(result)
         
-    def test_handoff_creation(self):
+    async def test_handoff_creation(self):
         """Test project handoff functionality"""
         project_data = {
             "name": "TestProject",
@@ -178,29 +191,20 @@ class TestMultiPlatformIntegrator(unittest.TestCase):
             "requirements": ["python>=3.8"]
         }
         instructions = "Continue development with these specifications"
-        
-        # Create handoff (this will run synchronously for testing)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(
-                self.integrator.handoff_to_deepagent(project_data, instructions)
-            )
-            
-            self.assertIsInstance(result, dict)
-            self.assertTrue(result.get('success', False))
-            self.assertIn('handoff_file', result)
-            
-            # Verify file was created
-            filename = result['handoff_file']
-            self.assertTrue(os.path.exists(filename))
-            
-            # Clean up
-            os.remove(filename)
-            
-        finally:
-            loop.close()
+
+        # Mock the file write so the handoff path runs without disk I/O
+        with mock.patch("integrations.multi_platform.open",
+                        mock.mock_open()) as mocked_open:
+            result = await self.integrator.handoff_to_deepagent(project_data, instructions)
+
+        self.assertIsInstance(result, dict)
+        self.assertTrue(result.get('success', False))
+        self.assertIn('handoff_file', result)
+
+        # Verify the package went through the writer
+        mocked_open.assert_called_once_with(result['handoff_file'], 'wb')
+        written = mocked_open.return_value.write.call_args[0][0]
+        self.assertIn(b'"TestProject"', written)
             
     def test_space_config_creation(self):
         """Test AI space configuration creation"""
@@ -221,42 +225,35 @@ class TestMultiPlatformIntegrator(unittest.TestCase):
     def test_integration_status(self):
         """Test integration status reporting"""
         status = self.integrator.get_integration_status()
-        
+
         self.assertIsInstance(status, dict)
-        self.assertIn('perplexity', status)
-        self.assertIn('abacus', status)
-        self.assertIn('deepagent', status)
-        
-        for platform, info in status.items():
-            self.assertIn('configured', info)
-            self.assertIn('active', info)
-            self.assertIn('endpoint', info)
+
+        # Structural compares instead of per-key assertIn loops
+        expected_platforms = {'perplexity', 'abacus', 'deepagent'}
+        self.assertTrue(expected_platforms.issubset(status))
+
+        expected_keys = {'configured', 'active', 'endpoint'}
+        for info in status.values():
+            self.assertTrue(expected_keys.issubset(info))
             
-class TestAutonomousScheduler(unittest.TestCase):
+class TestAutonomousScheduler(RandyAIDbMixin, unittest.TestCase):
     """Test autonomous scheduler functionality"""
-    
+
     def setUp(self):
         """Set up test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, "test_scheduler.db")
-        
-        self.randy_ai = RandyAI()
-        self.randy_ai.db_path = Path(self.test_db_path)
-        self.randy_ai.init_database()
-        
+        super().setUp()
+        from autonomous.scheduler import AutonomousScheduler
+
         self.scheduler = AutonomousScheduler(self.randy_ai)
-        
-    def tearDown(self):
-        """Clean up test environment"""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        os.rmdir(self.temp_dir)
-        
+
+    @freeze_time("2024-01-01 12:00:00")
     def test_daily_update_generation(self):
         """Test autonomous daily update generation"""
-        # Add some test data
-        self.randy_ai.create_task("High Priority Task", "Important task", 9)
-        self.randy_ai.learn_from_interaction("test", "response", 0.8)
+        # Add some test data in one transaction
+        self.randy_ai.bulk_seed(
+            tasks=[("High Priority Task", "Important task", 9, None)],
+            learning=[("test", "response", 0.8)]
+        )
         
         # Generate daily update
         self.scheduler.generate_daily_update()
@@ -300,6 +297,7 @@ class TestAutonomousScheduler(unittest.TestCase):
         self.assertIn('scheduled_jobs', status)
         self.assertIn('custom_tasks', status)
         
+    @freeze_time("2024-01-01 12:00:00")
     def test_reminder_creation(self):
         """Test reminder creation"""
         title = "Test Reminder"
@@ -313,28 +311,22 @@ class TestAutonomousScheduler(unittest.TestCase):
         
 class TestQuestionGenerator(unittest.TestCase):
     """Test question generation functionality"""
-    
+
     def setUp(self):
         """Set up test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, "test_questions.db")
-        
-        self.randy_ai = RandyAI()
-        self.randy_ai.db_path = Path(self.test_db_path)
-        self.randy_ai.init_database()
-        
+        from core.randy_ai import RandyAI
+        from autonomous.scheduler import QuestionGenerator
+
+        # Question generation only reads in-process state; an in-memory
+        # instance keeps the constructor off the real database
+        self.randy_ai = RandyAI(":memory:", test_mode=True)
         self.question_gen = QuestionGenerator(self.randy_ai)
-        
-    def tearDown(self):
-        """Clean up test environment"""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        os.rmdir(self.temp_dir)
-        
+
     def test_contextual_question_generation(self):
         """Test contextual question generation"""
-        # Add some context to memory
-        self.randy_ai.save_memory("recent_car_search", "Toyota Corolla modifications", "search")
+        # Add some context to memory; defer keeps the write in-process
+        self.randy_ai.save_memory("recent_car_search", "Toyota Corolla modifications",
+                                  "search", defer=True)
         
         question = self.question_gen.generate_contextual_question()
         
@@ -345,8 +337,8 @@ class TestQuestionGenerator(unittest.TestCase):
     def test_question_templates(self):
         """Test question template system"""
         templates = self.question_gen.question_templates
-        
-        self.assertIsInstance(templates, list)
+
+        self.assertIsInstance(templates, tuple)
         self.assertGreater(len(templates), 0)
         
         # All templates should contain placeholders
@@ -355,42 +347,37 @@ class TestQuestionGenerator(unittest.TestCase):
             
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete system"""
-    
+
+    @pytest.fixture(autouse=True)
+    def _db_path(self, tmp_path):
+        """Per-test database path; pytest owns and batches the cleanup"""
+        self.test_db_path = str(tmp_path / "test_integration.db")
+
     def setUp(self):
         """Set up integration test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, "test_integration.db")
-        
-        # Initialize complete system
-        self.randy_ai = RandyAI()
-        self.randy_ai.db_path = Path(self.test_db_path)
-        self.randy_ai.init_database()
+        from core.randy_ai import RandyAI
+        from integrations.multi_platform import EnhancedRandyAI
+        from autonomous.scheduler import AutonomousScheduler, QuestionGenerator
+
+        # Initialize complete system on a template copy in the temp dir
+        _fresh_test_db(self.test_db_path)
+        self.randy_ai = RandyAI(Path(self.test_db_path), test_mode=True)
         
         self.enhanced_ai = EnhancedRandyAI(self.randy_ai)
         self.scheduler = AutonomousScheduler(self.randy_ai)
         self.question_gen = QuestionGenerator(self.randy_ai)
         
-    def tearDown(self):
-        """Clean up integration test environment"""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
-        os.rmdir(self.temp_dir)
-        
     def test_complete_workflow(self):
         """Test complete AI workflow"""
-        # 1. Save user preferences and context
-        self.randy_ai.save_memory("user_project", "AI assistant development", "projects")
-        
-        # 2. Create tasks
-        task_id = self.randy_ai.create_task("Test AI Integration", "Complete integration testing", 8)
-        self.assertIsInstance(task_id, int)
-        
-        # 3. Learn from interaction
-        self.randy_ai.learn_from_interaction(
-            "How to test AI integration?",
-            "Use comprehensive test suite with unit and integration tests",
-            0.9
+        # 1-3. Seed context, tasks and learning data in one transaction
+        task_ids = self.randy_ai.bulk_seed(
+            tasks=[("Test AI Integration", "Complete integration testing", 8, None)],
+            memory={"user_project": ("AI assistant development", "projects")},
+            learning=[("How to test AI integration?",
+                       "Use comprehensive test suite with unit and integration tests",
+                       0.9)]
         )
+        self.assertIsInstance(task_ids[0], int)
         
         # 4. Generate autonomous insights
         insights = self.scheduler.generate_autonomous_insights()
@@ -411,6 +398,7 @@ class TestIntegration(unittest.TestCase):
         self.assertIn('memory_items', status)
         self.assertGreater(status['memory_items'], 0)
         
+    @freeze_time("2024-01-01 12:00:00")
     def test_data_persistence(self):
         """Test data persistence across sessions"""
         # Create and save data
@@ -419,52 +407,16 @@ class TestIntegration(unittest.TestCase):
         
         self.randy_ai.save_memory(test_memory_key, test_memory_value, "test")
         
+        from core.randy_ai import RandyAI
+
         # Create new instance (simulating restart)
-        new_randy_ai = RandyAI()
-        new_randy_ai.db_path = Path(self.test_db_path)
-        new_randy_ai.load_memory()
-        
-        # Verify data persistence
-        self.assertIn(test_memory_key, new_randy_ai.memory)
-        self.assertEqual(new_randy_ai.memory[test_memory_key], test_memory_value)
+        new_randy_ai = RandyAI(Path(self.test_db_path), test_mode=True)
+
+        # Verify data persistence with a single-row read instead of
+        # hydrating the whole memory store
+        self.assertEqual(new_randy_ai.get_memory(test_memory_key), test_memory_value)
         
 if __name__ == '__main__':
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test classes
-    test_classes = [
-        TestRandyAICore,
-        TestMultiPlatformIntegrator,
-        TestAutonomousScheduler,
-        TestQuestionGenerator,
-        TestIntegration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Print summary
-    print(f"\n{'='*50}")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-    if result.failures:
-        print("\nFailures:")
-        for test, traceback in result.failures:
-            print(f"- {test}: {traceback}")
-            
-    if result.errors:
-        print("\nErrors:")
-        for test, traceback in result.errors:
-            print(f"- {test}: {traceback}")
-            
-    # Exit with proper code
-    exit_code = 0 if result.wasSuccessful() else 1
-    sys.exit(exit_code)
\ No newline at end of file
+    # Defer to pytest so direct invocation gets the same parallel
+    # workers and plugins as the configured runner
+    sys.exit(pytest.main([__file__, "-n", "auto", "-v"]))
\ No newline at end of file